@@ -15,6 +15,7 @@ import logging
 import subprocess
 
 from datalad.interface.common_opts import (
+    jobs_opt,
     recursion_flag,
     recursion_limit
 )
@@ -57,6 +58,7 @@ from datalad.core.distributed.clone import (
     decode_source_spec
 )
 from datalad.log import log_progress
+from datalad.support.parallel import ProducerConsumer
 from datalad.customremotes.ria_utils import (
     get_layout_locations,
     verify_ria_url,
@@ -231,6 +233,7 @@ class CreateSiblingRia(Interface):
             doc="""specify a trust level for the storage sibling. If not
             specified, the default git-annex trust level is used. 'trust'
             should be used with care (see the git-annex-trust man page).""",),
+        jobs=jobs_opt,
         disable_storage__=Parameter(
             args=("--no-storage-sibling",),
             dest='disable_storage__',
@@ -255,7 +258,8 @@ class CreateSiblingRia(Interface):
                  recursive=False,
                  recursion_limit=None,
                  disable_storage__=None,
-                 push_url=None
+                 push_url=None,
+                 jobs='auto',
                  ):
         if disable_storage__ is not None:
             import warnings
@@ -406,13 +410,11 @@ class CreateSiblingRia(Interface):
         if recursive:
             # Note: subdatasets can be treated independently, so go full
             # recursion when querying for them and _no_recursion with the
-            # actual call. Theoretically this can be parallelized.
+            # actual call. Each of them gets its own location in the store,
+            # hence we can process them in parallel.
 
-            for subds in ds.subdatasets(fulfilled=True,
-                                        recursive=True,
-                                        recursion_limit=recursion_limit,
-                                        result_xfm='datasets'):
-                yield from _create_sibling_ria(
+            def _create_sibling_ria_subds(subds):
+                return _create_sibling_ria(
                     subds,
                     url,
                     push_url,
@@ -426,6 +428,16 @@ class CreateSiblingRia(Interface):
                     trust_level,
                     res_kwargs)
 
+            yield from ProducerConsumer(
+                ds.subdatasets(fulfilled=True,
+                               recursive=True,
+                               recursion_limit=recursion_limit,
+                               result_xfm='datasets'),
+                _create_sibling_ria_subds,
+                producer_future_key=lambda subds: subds.path,
+                jobs=jobs,
+            )
+
 
 def _create_sibling_ria(
         ds,
@@ -59,6 +59,7 @@ from datalad.support.network import (
     urlquote,
 )
 from datalad.support.parallel import (
+    ProducerConsumer,
     ProducerConsumerProgressLog,
 )
 from datalad.dochelpers import (
@@ -68,6 +69,7 @@ from datalad.utils import (
     unique,
     Path,
     get_dataset_root,
+    path_is_subpath,
 )
 
 from datalad.local.subdatasets import Subdatasets
@@ -523,6 +525,36 @@ def _recursive_install_subds_underneath(ds, recursion_limit, reckless, start=Non
         yield from producer_consumer
 
 
+def _group_overlapping_results(sdsress):
+    """Group subdatasets() results which could touch the same datasets
+
+    Results get compared by their path and the paths they contain. Results
+    with the same paths, or with paths underneath each other, end up in the
+    same group, so they get explored one after another.
+
+    Returns
+    -------
+    list of lists
+      Groups of results, ordered by their first result, each in the order
+      of `sdsress`.
+    """
+    groups = []  # (paths, indices of results)
+    for i, sdsres in enumerate(sdsress):
+        paths = {sdsres['path']}
+        paths.update(str(p) for p in sdsres.get('contains', []))
+        idx = [i]
+        for group in [
+                g for g in groups
+                if any(a == b or path_is_subpath(a, b) or path_is_subpath(b, a)
+                       for a in paths for b in g[0])]:
+            groups.remove(group)
+            paths.update(group[0])
+            idx.extend(group[1])
+        groups.append((paths, sorted(idx)))
+    return [[sdsress[i] for i in idx]
+            for _, idx in sorted(groups, key=lambda g: g[1][0])]
+
+
 def _install_targetpath(
         ds,
         target_path,
@@ -841,23 +873,11 @@ class Get(Interface):
         refds = require_dataset(
             dataset, check_installed=True, purpose='get content')
 
-        content_by_ds = {}
-        # use subdatasets() to discover any relevant content that is not
-        # already present in the root dataset (refds)
-        for sdsres in Subdatasets.__call__(
-                contains=path,
-                # maintain path argument semantics and pass in dataset arg
-                # as is
-                dataset=dataset,
-                # always come from the top to get sensible generator behavior
-                bottomup=False,
-                # when paths are given, they will constrain the recursion
-                # automatically, and we need to enable recursion so we can
-                # location path in subdatasets several levels down
-                recursive=True if path else recursive,
-                recursion_limit=None if path else recursion_limit,
-                return_type='generator',
-                on_failure='ignore'):
+        def explore(sdsres, content_by_ds):
+            """Install whatever is needed to get to the paths of a result
+
+            Datasets containing target paths get recorded in `content_by_ds`
+            """
             if sdsres.get('type', None) != 'dataset':
                 # if it is not about a 'dataset' it is likely content in
                 # the root dataset
@@ -874,7 +894,7 @@ class Get(Interface):
                             message=('path not associated with dataset %s',
                                      refds),
                         )
-                        continue
+                        return
                     # check if we need to obtain anything underneath this path
                     # the subdataset() call above will only look _until_ it
                     # hits the targetpath
@@ -903,9 +923,9 @@ class Get(Interface):
                 else:
                     # dunno what this is, send upstairs
                     yield sdsres
-                # must continue for both conditional branches above
+                # must return for both conditional branches above
                 # the rest is about stuff in real subdatasets
-                continue
+                return
             # instance of the closest existing dataset for this result
             ds = Dataset(sdsres['parentds']
                          if sdsres.get('state', None) == 'absent'
@@ -938,6 +958,53 @@ class Get(Interface):
                     if res.get('status', None) != 'notneeded' or not known_ds:
                         yield res
 
+        content_by_ds = {}
+        # use subdatasets() to discover any relevant content that is not
+        # already present in the root dataset (refds)
+        sdsress = Subdatasets.__call__(
+            contains=path,
+            # maintain path argument semantics and pass in dataset arg
+            # as is
+            dataset=dataset,
+            # always come from the top to get sensible generator behavior
+            bottomup=False,
+            # when paths are given, they will constrain the recursion
+            # automatically, and we need to enable recursion so we can
+            # location path in subdatasets several levels down
+            recursive=True if path else recursive,
+            recursion_limit=None if path else recursion_limit,
+            return_type='generator',
+            on_failure='ignore')
+        groups = None
+        if isinstance(jobs, int) and jobs > 1:
+            # installing what one result needs could change what would be
+            # discovered for a following one, hence discover everything
+            # first and explore in parallel only what cannot overlap
+            sdsress = list(sdsress)
+            groups = _group_overlapping_results(sdsress)
+        if not groups or len(groups) < 2:
+            for sdsres in sdsress:
+                yield from explore(sdsres, content_by_ds)
+        else:
+            def explore_group(i):  # consumer
+                group_content = {}
+                results = [res for sdsres in groups[i]
+                           for res in explore(sdsres, group_content)]
+                return i, results, group_content
+
+            # report in the order of discovery, not of completion
+            explored = {}
+            next_i = 0
+            for i, results, group_content in ProducerConsumer(
+                    range(len(groups)), explore_group, jobs=jobs):
+                explored[i] = results, group_content
+                while next_i in explored:
+                    results, group_content = explored.pop(next_i)
+                    for ds, content in group_content.items():
+                        content_by_ds.setdefault(ds, set()).update(content)
+                    yield from results
+                    next_i += 1
+
         if not get_data:
             # done already
             return
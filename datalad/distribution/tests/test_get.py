@@ -22,7 +22,10 @@ from datalad.api import (
     install,
 )
 from datalad.interface.results import only_matching_paths
-from datalad.distribution.get import _get_flexible_source_candidates_for_submodule
+from datalad.distribution.get import (
+    _get_flexible_source_candidates_for_submodule,
+    _group_overlapping_results,
+)
 from datalad.support.annexrepo import AnnexRepo
 from datalad.support.exceptions import (
     InsufficientArgumentsError,
@@ -460,6 +463,39 @@ def test_get_greedy_recurse_subdatasets(src, path):
     ok_(subds2.repo.file_has_content('test-annex.dat') is True)
 
 
+def test_group_overlapping_results():
+    a = {'path': '/ds/a', 'contains': ['/ds/a/sub/f']}
+    b = {'path': '/ds/b'}
+    sub = {'path': '/ds/a/sub', 'contains': ['/ds/a/sub/g']}
+    c = {'path': '/ds/c', 'contains': ['/ds/c/f']}
+    eq_(_group_overlapping_results([]), [])
+    eq_(_group_overlapping_results([a, b, sub, c]), [[a, sub], [b], [c]])
+    # a path reported for the root dataset joins what it contains
+    d = {'path': '/ds', 'contains': ['/ds/b/f']}
+    eq_(_group_overlapping_results([a, b, d, c]), [[a, b, d, c]])
+
+
+@with_tempfile(mkdir=True)
+@with_tempfile(mkdir=True)
+def test_get_recursive_overlapping_paths(src, path):
+    origin = Dataset(src).create()
+    for i in range(2):
+        origin.create(opj('d', 'sub%d' % i)).create('subsub')
+    origin.create('e')
+    origin.save(recursive=True)
+    clone = install(
+        path, source=src, result_xfm='datasets', return_type='item-or-list')
+    # exploring 'd' recursively installs the very subdatasets which are
+    # the other paths under 'd', only 'e' is independent
+    res = clone.get(
+        ['d', opj('d', 'sub0'), opj('d', 'sub1', 'subsub'), 'e'],
+        recursive=True, get_data=False, jobs=3, on_failure='ignore')
+    assert_status(('ok', 'notneeded'), res)
+    subdss = clone.subdatasets(recursive=True, result_xfm='datasets')
+    eq_(len(subdss), 5)
+    ok_(all(sub.is_installed() for sub in subdss))
+
+
 @with_testrepos('submodule_annex', flavors='local')
 @with_tempfile(mkdir=True)
 def test_get_install_missing_subdataset(src, path):
@@ -11,6 +11,7 @@
 
 import logging
 import os
+import tempfile
 
 from os.path import (
     join as opj,
@@ -29,6 +30,7 @@ from datalad.utils import (
     chpwd,
     on_windows,
     getpwd,
+    get_tempfile_kwargs,
     _path_,
     rmtree,
     Path,
@@ -42,12 +44,16 @@ from datalad.support.exceptions import (
 from datalad.support.gitrepo import GitRepo
 from datalad.support.annexrepo import AnnexRepo
 from datalad.cmd import WitlessRunner as Runner
+from datalad.support.parallel import ProducerConsumer
 from datalad.tests.utils import (
+    attr,
     skip_ssh,
     create_tree,
     with_tempfile,
     assert_in,
     with_tree,
+    get_dataset_copy,
+    get_tempdir_for_module,
     with_testrepos,
     eq_,
     ok_,
@@ -55,14 +61,15 @@ from datalad.tests.utils import (
     ok_file_has_content,
     assert_not_in,
     assert_raises,
+    assert_is,
     assert_is_instance,
     assert_repo_status,
     assert_result_count,
     assert_status,
     assert_in_results,
     DEFAULT_BRANCH,
+    HTTPPath,
     ok_startswith,
-    serve_path_via_http,
     swallow_logs,
     use_cassette,
     skip_if_no_network,
@@ -77,15 +84,85 @@ from datalad.tests.utils import (
 )
 from ..dataset import Dataset
 
+# Tests in this module may be distributed across workers by nose's
+# multiprocess plugin (e.g. `nosetests --processes=4`).  The state they share
+# (the template dataset of get_dataset_copy() and the HTTP server of
+# _get_http_tree()) is created lazily within each worker process, and
+# teardown_module() runs in each of them, so it does not need to be shared
+# across workers
+_multiprocess_can_split_ = True
+
 ###############
 # Test helpers:
 ###############
 
+_http_server = None
+
+
+def teardown_module():
+    if _http_server is not None:
+        _http_server.stop()
+
+
+def _get_http_tree(tree):
+    """Create `tree` in a new directory served via HTTP
+
+    A single server is started upon first use and shared by all tests in this
+    module, each test gets its own directory underneath its root.
+
+    Returns
+    -------
+    path, url
+      Path of the created tree, and the URL it is served under.
+    """
+    global _http_server
+    if _http_server is None:
+        _http_server = HTTPPath(get_tempdir_for_module('http_root'))
+        _http_server.start()
+    path = tempfile.mkdtemp(**get_tempfile_kwargs(
+        {'dir': _http_server.path}, prefix='tree'))
+    create_tree(path, tree)
+    return path, _http_server.url + basename(path) + '/'
+
+
+def _create_empty_ds(path):
+    """Populate an empty dataset, a template for get_dataset_copy"""
+    create(path, force=True)
+
+
+def _get_has_content(dss):
+    """Return `has_content` of all annexed files, by dataset path
+
+    git-annex can only be queried one repository at a time, so the queries
+    for the given datasets are run in parallel.
+    """
+    dss = list(dss)
+
+    def get_has_content(ds):
+        ainfo = ds.repo.get_content_annexinfo(init=None,
+                                              eval_availability=True)
+        return ds.path, [st["has_content"] for st in ainfo.values()]
+
+    return dict(ProducerConsumer(dss, get_has_content, jobs=len(dss)))
+
+
+def _subdatasets_by_state(ds, recursive=False):
+    """Return relative paths of fulfilled and unfulfilled subdatasets of `ds`
+
+    Uses a single subdatasets() query instead of one per `fulfilled` value,
+    telling them apart by the 'state' it reports.
+    """
+    fulfilled, unfulfilled = set(), set()
+    for sds in ds.subdatasets(recursive=recursive,
+                              result_renderer='disabled'):
+        (unfulfilled if sds.get('state') == 'absent' else fulfilled).add(
+            op.relpath(sds['path'], ds.path))
+    return fulfilled, unfulfilled
+
 
-@with_tree(tree={'file.txt': '123'})
-@serve_path_via_http
 @with_tempfile
-def _test_guess_dot_git(annex, path, url, tdir):
+def _test_guess_dot_git(annex, tdir):
+    path, url = _get_http_tree({'file.txt': '123'})
     repo = (AnnexRepo if annex else GitRepo)(path, create=True)
     repo.add('file.txt', git=not annex)
     repo.commit()
@@ -105,9 +182,14 @@ def _test_guess_dot_git(annex, path, url, tdir):
     assert_repo_status(tdir, annex=annex)
 
 
-def test_guess_dot_git():
-    for annex in False, True:
-        yield _test_guess_dot_git, annex
+@attr('serve_path_via_http')
+def test_guess_dot_git_git():
+    _test_guess_dot_git(False)
+
+
+@attr('serve_path_via_http')
+def test_guess_dot_git_annex():
+    _test_guess_dot_git(True)
 
 
 ######################
@@ -130,7 +212,7 @@ def test_invalid_args(path):
     # install to a remote location
     assert_raises(ValueError, install, 'ssh://mars/Zoidberg', source='Zoidberg')
     # make fake dataset
-    ds = create(path)
+    ds = get_dataset_copy(_create_empty_ds, path)
     assert_raises(IncompleteResultsError, install, '/higherup.', 'Zoidberg', dataset=ds)
 
 
@@ -286,12 +368,10 @@ def test_install_dataset_from_just_source_via_path(url, path):
     assert_in('INFO.txt', ds.repo.get_indexed_files())
 
 
-@with_tree(tree={
-    'ds': {'test.txt': 'some'},
-    })
-@serve_path_via_http
+@attr('serve_path_via_http')
 @with_tempfile(mkdir=True)
-def test_install_dataladri(src, topurl, path):
+def test_install_dataladri(path):
+    src, topurl = _get_http_tree({'ds': {'test.txt': 'some'}})
     # make plain git repo
     ds_path = opj(src, 'ds')
     gr = GitRepo(ds_path, create=True)
@@ -315,12 +395,10 @@ def test_install_recursive(src, path_nr, path_r):
     # first install non-recursive:
     ds = install(path_nr, source=src, recursive=False)
     ok_(ds.is_installed())
-    for sub in ds.subdatasets(recursive=True, result_xfm='datasets'):
-        ok_(not sub.is_installed(),
-            "Unintentionally installed: %s" % (sub,))
+    fulfilled, unfulfilled = _subdatasets_by_state(ds, recursive=True)
+    eq_(fulfilled, set(), "Unintentionally installed: %s" % (fulfilled,))
     # this also means, subdatasets to be listed as not fulfilled:
-    eq_(set(ds.subdatasets(recursive=True, fulfilled=False, result_xfm='relpaths')),
-        {'subm 1', '2'})
+    eq_(unfulfilled, {'subm 1', '2'})
 
     # now recursively:
     # don't filter implicit results so we can inspect them
@@ -335,22 +413,23 @@ def test_install_recursive(src, path_nr, path_r):
     ok_(top_ds.is_installed())
 
     # the subdatasets are contained in returned list:
-    # (Note: Until we provide proper (singleton) instances for Datasets,
-    # need to check for their paths)
     assert_in_results(res, path=opj(top_ds.path, 'subm 1'), type='dataset')
     assert_in_results(res, path=opj(top_ds.path, '2'), type='dataset')
 
-    eq_(len(top_ds.subdatasets(recursive=True)), 2)
+    top_subds = top_ds.subdatasets(recursive=True, result_xfm='datasets')
+    eq_(len(top_subds), 2)
+    # Dataset instances are flyweights, the very same instances are reported
+    # for the same paths
+    for subds in top_subds:
+        assert_is(subds, Dataset(subds.path))
 
-    for subds in top_ds.subdatasets(recursive=True, result_xfm='datasets'):
+    # no unfulfilled subdatasets:
+    for subds in top_subds:
         ok_(subds.is_installed(),
             "Not installed: %s" % (subds,))
-        # no content was installed:
-        ainfo = subds.repo.get_content_annexinfo(init=None,
-                                                 eval_availability=True)
-        assert_false(any(st["has_content"] for st in ainfo.values()))
-    # no unfulfilled subdatasets:
-    ok_(top_ds.subdatasets(recursive=True, fulfilled=False) == [])
+    # no content was installed:
+    for has_content in _get_has_content(top_subds).values():
+        assert_false(any(has_content))
 
     # check if we can install recursively into a dataset
     # https://github.com/datalad/datalad/issues/2982
@@ -382,17 +461,14 @@ def test_install_recursive_with_data(src, path):
     top_ds = YieldDatasets()(res[0])
     ok_(top_ds.is_installed())
 
-    def all_have_content(repo):
-        ainfo = repo.get_content_annexinfo(init=None, eval_availability=True)
-        return all(st["has_content"] for st in ainfo.values())
-
-    if isinstance(top_ds.repo, AnnexRepo):
-        ok_(all_have_content(top_ds.repo))
-
-    for subds in top_ds.subdatasets(recursive=True, result_xfm='datasets'):
+    subdss = top_ds.subdatasets(recursive=True, result_xfm='datasets')
+    for subds in subdss:
         ok_(subds.is_installed(), "Not installed: %s" % (subds,))
-        if isinstance(subds.repo, AnnexRepo):
-            ok_(all_have_content(subds.repo))
+
+    for ds_path, has_content in _get_has_content(
+            ds for ds in [top_ds] + subdss
+            if isinstance(ds.repo, AnnexRepo)).items():
+        ok_(all(has_content), "Not all content present in %s" % ds_path)
 
 
 # https://github.com/datalad/datalad/pull/3975/checks?check_run_id=369789022#step:8:555
@@ -406,7 +482,7 @@ def test_install_recursive_with_data(src, path):
 @with_tempfile
 def test_install_into_dataset(source, top_path):
 
-    ds = create(top_path)
+    ds = get_dataset_copy(_create_empty_ds, top_path)
     assert_repo_status(ds.path)
 
     subds = ds.install("sub", source=source)
@@ -415,11 +491,10 @@ def test_install_into_dataset(source, top_path):
     assert_in('sub', ds.subdatasets(result_xfm='relpaths'))
     # sub is clean:
     assert_repo_status(subds.path, annex=None)
-    # top is too:
-    assert_repo_status(ds.path, annex=None)
-    ds.save(message='addsub')
-    # now it is:
+    # top is too, install saved the new subdataset already
     assert_repo_status(ds.path, annex=None)
+    # hence there is nothing left to be saved, and the state is unchanged
+    assert_status('notneeded', ds.save(message='addsub'))
 
     # but we could also save while installing and there should be no side-effect
     # of saving any other changes if we state to not auto-save changes
@@ -445,7 +520,7 @@ def test_install_into_dataset(source, top_path):
 @use_cassette('test_install_crcns')
 @with_tempfile
 def test_failed_install_multiple(top_path):
-    ds = create(top_path)
+    ds = get_dataset_copy(_create_empty_ds, top_path)
 
     create(_path_(top_path, 'ds1'))
     create(_path_(top_path, 'ds3'))
@@ -478,8 +553,9 @@ def test_install_known_subdataset(src, path):
     # subdataset not installed:
     subds = Dataset(opj(path, 'subm 1'))
     assert_false(subds.is_installed())
-    assert_in('subm 1', ds.subdatasets(fulfilled=False, result_xfm='relpaths'))
-    assert_not_in('subm 1', ds.subdatasets(fulfilled=True, result_xfm='relpaths'))
+    fulfilled, unfulfilled = _subdatasets_by_state(ds)
+    assert_in('subm 1', unfulfilled)
+    assert_not_in('subm 1', fulfilled)
     # install it:
     ds.install('subm 1')
     ok_(subds.is_installed())
@@ -488,8 +564,9 @@ def test_install_known_subdataset(src, path):
     # new repository initiated
     eq_(set(subds.repo.get_indexed_files()),
         {'test.dat', 'INFO.txt', 'test-annex.dat'})
-    assert_not_in('subm 1', ds.subdatasets(fulfilled=False, result_xfm='relpaths'))
-    assert_in('subm 1', ds.subdatasets(fulfilled=True, result_xfm='relpaths'))
+    fulfilled, unfulfilled = _subdatasets_by_state(ds)
+    assert_not_in('subm 1', unfulfilled)
+    assert_in('subm 1', fulfilled)
 
     # now, get the data by reinstalling with -g:
     ok_(subds.repo.file_has_content('test-annex.dat') is False)
@@ -542,7 +619,7 @@ def test_implicit_install(src, dst):
     assert_raises(IncompleteResultsError, ds.install, source=opj('sub', 'obscure'))
 
     # clean up, the nasty way
-    rmtree(dst, chmod_files=True)
+    rmtree(dst)
     ok_(not exists(dst))
 
     # again first toplevel:
@@ -566,7 +643,7 @@ def test_implicit_install(src, dst):
 
 @with_tempfile(mkdir=True)
 def test_failed_install(dspath):
-    ds = create(dspath)
+    ds = get_dataset_copy(_create_empty_ds, dspath)
     assert_raises(IncompleteResultsError,
                   ds.install,
                   "sub",
@@ -592,8 +669,9 @@ def test_install_list(path, top_path):
                   path=['subm 1', '2'],
                   source='something')
 
-    # now should work:
-    result = ds.install(path=['subm 1', '2'], result_xfm='paths')
+    # now should work (and independent subdatasets can be installed in
+    # parallel):
+    result = ds.install(path=['subm 1', '2'], jobs=2, result_xfm='paths')
     ok_(sub1.is_installed())
     ok_(sub2.is_installed())
     eq_(set(result), {sub1.path, sub2.path})
@@ -743,10 +821,8 @@ def test_install_noautoget_data(src, path):
     cdss = install(path, source=src, recursive=True, result_filter=None)
     # there should only be datasets in the list of installed items,
     # and none of those should have any data for their annexed files yet
-    for ds in cdss:
-        ainfo = ds.repo.get_content_annexinfo(init=None,
-                                              eval_availability=True)
-        assert_false(any(st["has_content"] for st in ainfo.values()))
+    for has_content in _get_has_content(cdss).values():
+        assert_false(any(has_content))
 
 
 @with_tempfile
@@ -904,8 +980,11 @@ def check_datasets_datalad_org(suffix, tdir):
 
 
 def test_datasets_datalad_org():
-    yield check_datasets_datalad_org, ''
-    yield check_datasets_datalad_org, '/.git'
+    check_datasets_datalad_org('')
+
+
+def test_datasets_datalad_org_dotgit():
+    check_datasets_datalad_org('/.git')
 
 
 # https://github.com/datalad/datalad/issues/3469
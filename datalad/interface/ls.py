@@ -19,9 +19,7 @@ from os.path import exists, lexists, join as opj, abspath, isabs
 from os.path import curdir, isfile, islink, isdir
 from os.path import relpath
 from os import lstat
-
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError
+from types import SimpleNamespace
 
 from ..utils import auto_repr
 from .base import Interface
@@ -33,7 +31,9 @@ from ..dochelpers import exc_str
 from ..support.param import Parameter
 from ..support import ansi_colors
 from ..support.constraints import EnsureStr, EnsureNone
+from ..support.parallel import ProducerConsumer
 from ..distribution.dataset import Dataset
+from .common_opts import jobs_opt
 
 from datalad.support.annexrepo import AnnexRepo
 from datalad.support.annexrepo import GitRepo
@@ -99,9 +99,9 @@ class Ls(Interface):
             constraints=EnsureStr() | EnsureNone()
         ),
         list_content=Parameter(
-            choices=(None, 'first10', 'md5', 'full'),
+            choices=(None, 'first10', 'md5', 'sha256', 'full'),
             doc="""list also the content or only first 10 bytes (first10), or md5
-            checksum of an entry.  Might require expensive transfer and dump
+            or sha256 checksum of an entry.  Might require expensive transfer and dump
             binary output to your screen.  Do not enable unless you know what you
             are after""",
             default=None
@@ -113,11 +113,13 @@ class Ls(Interface):
             file: writes each subdir metadata to json file in subdir of dataset or
             delete: deletes all metadata json files in dataset""",
         ),
+        jobs=jobs_opt,
     )
 
     @staticmethod
     def __call__(loc, recursive=False, fast=False, all_=False, long_=False,
-                 config_file=None, list_content=False, json=None):
+                 config_file=None, list_content=False, json=None,
+                 jobs='auto'):
         if json:
             from datalad.interface.ls_webui import _ls_json
 
@@ -128,7 +130,8 @@ class Ls(Interface):
         kw = dict(fast=fast, recursive=recursive, all_=all_, long_=long_)
         if isinstance(loc, list):
             return [Ls.__call__(loc_, config_file=config_file,
-                                list_content=list_content, json=json, **kw)
+                                list_content=list_content, json=json,
+                                jobs=jobs, **kw)
                     for loc_ in loc]
 
         # TODO: do some clever handling of kwargs as to remember what were defaults
@@ -142,7 +145,7 @@ class Ls(Interface):
         loc_type = "unknown"
         if loc.startswith('s3://'):
             return _ls_s3(loc, config_file=config_file, list_content=list_content,
-                          **kw)
+                          jobs=jobs, **kw)
         elif lexists(loc):
             if isdir(loc):
                 ds = Dataset(loc)
@@ -513,8 +516,85 @@ def _ls_dataset(loc, fast=False, recursive=False, all_=False, long_=False):
 #
 # S3 listing
 #
+def _list_s3_entries(acc, prefix, recursive=False, jobs=None):
+    """List entries under the prefix using a bucket's listing method `acc`
+
+    Listing is paginated, so a single recursive listing of a large bucket
+    takes many sequential round-trips.  For a recursive listing we therefore
+    first list the top level "directories" and then list them in parallel.
+    The entries are then merged back into key order, as a single recursive
+    listing would have returned them.
+    """
+    from boto.s3.prefix import Prefix
+    entries = list(acc(prefix, delimiter='/'))
+    if not recursive:
+        return entries
+    subprefixes = [e.name for e in entries if isinstance(e, Prefix)]
+    if not subprefixes:
+        return entries
+    sublistings = ProducerConsumer(
+        subprefixes,
+        lambda p: list(acc(p)),
+        jobs=jobs,
+    )
+    # S3 returns the keys of a page before its common prefixes, so the
+    # order has to be restored.  The sort is stable, so multiple versions
+    # of a key stay in the order they were listed in
+    return sorted(
+        [e for e in entries if not isinstance(e, Prefix)] +
+        [s for sublisting in sublistings for s in sublisting],
+        key=lambda e: e.name,
+    )
+
+
+def _check_key_url(e):
+    """Return the key along with its http:// url and the url's status"""
+    # OPT: delayed imports, needed only for S3 listing
+    from urllib.request import urlopen, Request
+    from urllib.error import HTTPError
+    from ..support.s3 import get_key_url
+    url = get_key_url(e, schema='http')
+    try:
+        # no need to fetch the content to check if it is accessible
+        urlopen(Request(url, method='HEAD')).close()
+        urlok = "OK"
+    except HTTPError as err:
+        urlok = "E: %s" % err.code
+    return e, (url, urlok)
+
+
+def _get_key_content(e, list_content):
+    """Return the content (or its checksum) of the key for listing"""
+    import hashlib
+    from boto.exception import S3ResponseError
+    from boto.s3.key import Key
+    # fetch via a fresh key, since the GET response would replace the
+    # last_modified and size of the listed one
+    key = Key(bucket=e.bucket, name=e.name)
+    # IO intensive, make an option finally!
+    try:
+        # _ = e.next()[:5]  if we are able to fetch the content
+        kwargs = dict(version_id=e.version_id)
+        if list_content in {'full', 'first10'}:
+            if list_content in 'first10':
+                kwargs['headers'] = {'Range': 'bytes=0-9'}
+            content = repr(key.get_contents_as_string(**kwargs))
+        elif list_content in {'md5', 'sha256'}:
+            digest = hashlib.new(list_content)
+            # stream the content through the digest, so there is no need to
+            # load all of it into memory
+            key.get_file(SimpleNamespace(write=digest.update), **kwargs)
+            content = digest.hexdigest()
+        else:
+            raise ValueError(list_content)
+        # content = "[S3: OK]"
+    except S3ResponseError as err:
+        content = str(err)
+    return " " + content
+
+
 def _ls_s3(loc, fast=False, recursive=False, all_=False, long_=False,
-           config_file=None, list_content=False):
+           config_file=None, list_content=False, jobs=None):
     """List S3 bucket content"""
     if loc.startswith('s3://'):
         bucket_prefix = loc[5:]
@@ -522,12 +602,11 @@ def _ls_s3(loc, fast=False, recursive=False, all_=False, long_=False,
         raise ValueError("passed location should be an s3:// url")
 
     import boto
-    from hashlib import md5
     from boto.s3.key import Key
     from boto.s3.prefix import Prefix
     from boto.s3.connection import OrdinaryCallingFormat
     from boto.exception import S3ResponseError
-    from ..support.configparserinc import SafeConfigParser  # provides PY2,3 imports
+    from configparser import ConfigParser
 
     if '/' in bucket_prefix:
         bucket_name, prefix = bucket_prefix.split('/', 1)
@@ -540,7 +619,7 @@ def _ls_s3(loc, fast=False, recursive=False, all_=False, long_=False,
 
     ui.message("Connecting to bucket: %s" % bucket_name)
     if config_file:
-        config = SafeConfigParser()
+        config = ConfigParser()
         config.read(config_file)
         access_key = config.get('default', 'access_key')
         secret_key = config.get('default', 'secret_key')
@@ -579,20 +658,25 @@ def _ls_s3(loc, fast=False, recursive=False, all_=False, long_=False,
         # should authenticate etc, and when ready we will ask for a bucket ;)
         bucket = downloader.access(lambda url: downloader.bucket, loc)
 
-    info = []
-    for iname, imeth in [
+    info_methods = [
         ("Versioning", bucket.get_versioning_status),
         ("   Website", bucket.get_website_endpoint),
         ("       ACL", bucket.get_acl),
-    ]:
+    ]
+
+    def get_info(item):
+        iname, imeth = item
         try:
             ival = imeth()
         except Exception as e:
             ival = str(e).split('\n')[0]
-        info.append(" {iname}: {ival}".format(**locals()))
-    ui.message("Bucket info:\n %s" % '\n '.join(info))
+        return iname, ival
 
-    kwargs = {} if recursive else {'delimiter': '/'}
+    # independent round-trips, so query them in parallel
+    info_values = dict(ProducerConsumer(info_methods, get_info, jobs=jobs))
+    info = [" {}: {}".format(iname, info_values[iname])
+            for iname, _ in info_methods]
+    ui.message("Bucket info:\n %s" % '\n '.join(info))
 
     ACCESS_METHODS = [
         bucket.list_versions,
@@ -603,7 +687,8 @@ def _ls_s3(loc, fast=False, recursive=False, all_=False, long_=False,
     got_versioned_list = False
     for acc in ACCESS_METHODS:
         try:
-            prefix_all_versions = list(acc(prefix, **kwargs))
+            prefix_all_versions = _list_s3_entries(
+                acc, prefix, recursive=recursive, jobs=jobs)
             got_versioned_list = acc is bucket.list_versions
             break
         except Exception as exc:
@@ -611,60 +696,65 @@ def _ls_s3(loc, fast=False, recursive=False, all_=False, long_=False,
 
     if not prefix_all_versions:
         ui.error("No output was provided for prefix %r" % prefix)
-    else:
-        max_length = max((len(e.name) for e in prefix_all_versions))
-        max_size_length = max((len(str(getattr(e, 'size', 0))) for e in prefix_all_versions))
+        prefix_all_versions = []
+
+    # widths of the columns, in a single pass through the entries
+    max_length = max_size_length = 0
+    for e in prefix_all_versions:
+        max_length = max(max_length, len(e.name))
+        max_size_length = max(
+            max_size_length, len(str(getattr(e, 'size', 0))))
+
+    def is_listed(e):
+        # only the latest versions are listed unless all were requested
+        return not got_versioned_list or e.is_latest or all_
 
+    def get_key_details(e):
+        _, (url, urlok) = _check_key_url(e)
+        try:
+            acl = e.get_acl()
+        except S3ResponseError as exc:
+            acl = exc.code if exc.code in ('AccessDenied',) else str(exc)
+        content = _get_key_content(e, list_content) if list_content else ""
+        return e, (url, urlok, acl, content)
+
+    key_details = {}
+    if long_:
+        # every key takes at least a round-trip, so query all in parallel.
+        # Details arrive in the order of completion, and get printed as
+        # soon as those of all preceding keys are known
+        key_details_iter = iter(ProducerConsumer(
+            (e for e in prefix_all_versions
+             if isinstance(e, Key) and is_listed(e)),
+            get_key_details,
+            jobs=jobs,
+        ))
+
+    # formats depend only on the widths, so prepare them once
+    base_fmt = "%%-%ds %%s" % max_length
+    size_fmt = " %%%dd" % max_size_length
     results = []
     for e in prefix_all_versions:
         results.append(e)
         if isinstance(e, Prefix):
-            ui.message("%s" % (e.name, ),)
+            ui.message(e.name)
             continue
 
-        base_msg = ("%%-%ds %%s" % max_length) % (e.name, e.last_modified)
+        base_msg = base_fmt % (e.name, e.last_modified)
         if isinstance(e, Key):
-            if got_versioned_list and not (e.is_latest or all_):
+            if not is_listed(e):
                 lgr.debug(
                     "Skipping Key since not all versions requested: %s", e)
                 # Skip this one
                 continue
-            ui.message(base_msg + " %%%dd" % max_size_length % e.size, cr=' ')
-            # OPT: delayed import
-            from ..support.s3 import get_key_url
-            url = get_key_url(e, schema='http')
-            try:
-                _ = urlopen(Request(url))
-                urlok = "OK"
-            except HTTPError as err:
-                urlok = "E: %s" % err.code
-
-            try:
-                acl = e.get_acl()
-            except S3ResponseError as exc:
-                acl = exc.code if exc.code in ('AccessDenied',) else str(exc)
-
-            content = ""
-            if list_content:
-                # IO intensive, make an option finally!
-                try:
-                    # _ = e.next()[:5]  if we are able to fetch the content
-                    kwargs = dict(version_id=e.version_id)
-                    if list_content in {'full', 'first10'}:
-                        if list_content in 'first10':
-                            kwargs['headers'] = {'Range': 'bytes=0-9'}
-                        content = repr(e.get_contents_as_string(**kwargs))
-                    elif list_content == 'md5':
-                        digest = md5()
-                        digest.update(e.get_contents_as_string(**kwargs))
-                        content = digest.hexdigest()
-                    else:
-                        raise ValueError(list_content)
-                    # content = "[S3: OK]"
-                except S3ResponseError as err:
-                    content = str(err)
-                finally:
-                    content = " " + content
+            ui.message(base_msg + size_fmt % e.size, cr=' ')
+            if long_:
+                while e not in key_details:
+                    k, details = next(key_details_iter)
+                    key_details[k] = details
+                url, urlok, acl, content = key_details.pop(e)
+            else:
+                url, urlok, acl, content = (None,) * 4
             ui.message(
                 "ver:%-32s  acl:%s  %s [%s]%s"
                 % (getattr(e, 'version_id', None),
@@ -672,5 +762,5 @@ def _ls_s3(loc, fast=False, recursive=False, all_=False, long_=False,
                 if long_ else ''
             )
         else:
-            ui.message(base_msg + " " + str(type(e)).split('.')[-1].rstrip("\"'>"))
+            ui.message(base_msg + " " + type(e).__name__)
     return results
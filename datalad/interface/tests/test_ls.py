@@ -25,11 +25,18 @@ from ...api import ls
 from ...utils import swallow_outputs, chpwd
 from ...tests.utils import assert_equal
 from ...tests.utils import assert_in
+from ...tests.utils import assert_not_in
 from ...tests.utils import DEFAULT_BRANCH
 from ...tests.utils import use_cassette
 from ...tests.utils import with_tempfile
+from ...tests.utils import with_tree
 from ...tests.utils import skip_if_no_network
 from ..ls import LsFormatter
+from ..ls import _check_key_url
+from ..ls import _get_key_content
+from ..ls import _list_s3_entries
+from ..ls import _ls_s3
+from os.path import join as opj
 from os.path import relpath
 from os import mkdir
 
@@ -53,6 +60,184 @@ def test_ls_s3():
 test_ls_s3.tags = ['network']
 
 
+def test_list_s3_entries():
+    from boto.s3.key import Key
+    from boto.s3.prefix import Prefix
+
+    # c/3 comes in two versions
+    names = ['a.txt', 'a/1', 'a/b/2', 'a0', 'b', 'c/3', 'c/3', 'c/4']
+
+    def acc(prefix, delimiter=None):
+        # mimics listing of S3 which collapses "directories" into a Prefix,
+        # listed after the keys
+        keys, prefixes = [], []
+        for i, n in enumerate(names):
+            if not n.startswith(prefix or ''):
+                continue
+            rest = n[len(prefix or ''):]
+            if delimiter and delimiter in rest:
+                p = (prefix or '') + rest.split(delimiter)[0] + delimiter
+                if not prefixes or prefixes[-1].name != p:
+                    prefixes.append(Prefix(name=p))
+            else:
+                key = Key(name=n)
+                key.version_id = str(i)
+                keys.append(key)
+        return keys + prefixes
+
+    for jobs in (0, 2):
+        assert_equal(
+            [e.name for e in _list_s3_entries(acc, None, jobs=jobs)],
+            ['a.txt', 'a0', 'b', 'a/', 'c/'])
+        entries = _list_s3_entries(acc, None, recursive=True, jobs=jobs)
+        assert_equal([e.name for e in entries], names)
+        # versions of a key keep their order
+        assert_equal(
+            [e.version_id for e in entries],
+            [str(i) for i in range(len(names))])
+        assert_equal(
+            [e.name
+             for e in _list_s3_entries(acc, 'a/', recursive=True, jobs=jobs)],
+            ['a/1', 'a/b/2'])
+
+
+def test_check_key_url():
+    from urllib.error import HTTPError
+    from boto.s3.bucket import Bucket
+    from boto.s3.key import Key
+
+    e = Key(bucket=Bucket(name='bucket'), name='a b')
+    e.version_id = 'v1'
+    url = 'http://bucket.s3.amazonaws.com/a%20b?versionId=v1'
+    with patch('urllib.request.urlopen') as urlopen:
+        assert_equal(_check_key_url(e), (e, (url, 'OK')))
+        # only the headers get requested
+        assert_equal(urlopen.call_args[0][0].get_method(), 'HEAD')
+        urlopen.side_effect = HTTPError(url, 403, 'Forbidden', {}, None)
+        assert_equal(_check_key_url(e), (e, (url, 'E: 403')))
+
+
+def test_get_key_content():
+    from boto.s3.key import Key
+
+    e = Key(name='a')
+    e.version_id = 'v1'
+    with patch.object(Key, 'get_contents_as_string',
+                      return_value=b'0123456789') as get:
+        assert_equal(_get_key_content(e, 'first10'), " b'0123456789'")
+        # only first 10 bytes are requested
+        get.assert_called_with(
+            version_id='v1', headers={'Range': 'bytes=0-9'})
+        assert_equal(_get_key_content(e, 'full'), " b'0123456789'")
+        get.assert_called_with(version_id='v1')
+
+    def get_file(fp, version_id=None):
+        fp.write(b'01234')
+        fp.write(b'56789')
+
+    with patch.object(Key, 'get_file', side_effect=get_file) as get_file_, \
+            patch.object(Key, 'get_contents_as_string') as get:
+        assert_equal(_get_key_content(e, 'md5'),
+                     " 781e5e245d69b566979b86e28d23f2c7")
+        assert_equal(
+            _get_key_content(e, 'sha256'),
+            " 84d89877f0d4041efb6bf91a16f0248f2fd573e6af05c19f96bedb9f882f7882")
+        assert_equal(get_file_.call_args[1], {'version_id': 'v1'})
+        # content is not loaded into memory
+        assert not get.called
+
+
+@with_tree(tree={'s3cfg': "[default]\naccess_key = A\nsecret_key = S\n"})
+def test_ls_s3_mocked(path):
+    from boto.s3.bucket import Bucket
+    from boto.s3.deletemarker import DeleteMarker
+    from boto.s3.key import Key
+    from boto.s3.prefix import Prefix
+
+    bucket = Bucket(name='bucket')
+    keys = []
+    for name, version_id, is_latest in [('a', 'v2', True),
+                                        ('a', 'v1', False),
+                                        ('sub/b', 'v1', True)]:
+        e = Key(bucket=bucket, name=name)
+        e.version_id, e.is_latest = version_id, is_latest
+        e.last_modified, e.size = '2020-01-01', 1
+        keys.append(e)
+    marker = DeleteMarker(bucket=bucket, name='c')
+    marker.last_modified = '2020-01-02'
+    keys.insert(2, marker)
+
+    def list_versions(prefix, delimiter=None):
+        if delimiter:
+            return keys[:3] + [Prefix(bucket=bucket, name='sub/')]
+        return [e for e in keys if e.name.startswith(prefix or '')]
+
+    bucket.list_versions = list_versions
+    bucket.get_versioning_status = lambda: {'Versioning': 'Enabled'}
+    bucket.get_website_endpoint = lambda: 'bucket.web'
+    bucket.get_acl = lambda: 'private'
+
+    with patch('boto.connect_s3') as connect_s3, \
+            patch('urllib.request.urlopen'), \
+            patch.object(Key, 'get_acl', return_value='acl'):
+        connect_s3.return_value.get_bucket.return_value = bucket
+        for recursive in False, True:
+            with swallow_outputs() as cmo:
+                res = _ls_s3('s3://bucket/', recursive=recursive,
+                             long_=True, config_file=opj(path, 's3cfg'),
+                             jobs=2)
+                assert_equal(
+                    [e.name for e in res],
+                    ['a', 'a', 'c'] + (['sub/b'] if recursive else ['sub/']))
+                assert_in("Versioning: {'Versioning': 'Enabled'}", cmo.out)
+                assert_in("Website: bucket.web", cmo.out)
+                assert_in("ACL: private", cmo.out)
+                # only the latest versions are listed
+                assert_equal(cmo.out.count("ver:v2 "), 1)
+                assert_equal(cmo.out.count("ver:v1 "), int(recursive))
+                assert_in(
+                    "acl:acl  http://bucket.s3.amazonaws.com/a?versionId=v2 "
+                    "[OK]", cmo.out)
+                assert_in(" 2020-01-02 DeleteMarker\n", cmo.out)
+
+    # details of a key are printed before those of the next one are queried
+    acl_calls = []
+
+    def get_acl(key):
+        acl_calls.append((key.name, cmo.out))
+        return 'acl'
+
+    with patch('boto.connect_s3') as connect_s3, \
+            patch('urllib.request.urlopen'), \
+            patch.object(Key, 'get_acl', autospec=True, side_effect=get_acl):
+        connect_s3.return_value.get_bucket.return_value = bucket
+        with swallow_outputs() as cmo:
+            _ls_s3('s3://bucket/', recursive=True, long_=True,
+                   config_file=opj(path, 's3cfg'), jobs=0)
+    assert_equal([name for name, _ in acl_calls], ['a', 'sub/b'])
+    assert_not_in("ver:v2 ", acl_calls[0][1])
+    assert_in("ver:v2 ", acl_calls[1][1])
+
+    def get_contents_as_string(key, **kwargs):
+        # like boto, take over the headers of the GET response
+        key.last_modified, key.size = 'Thu, 15 Oct 2026 00:00:00 GMT', 10
+        return b'0123456789'
+
+    with patch('boto.connect_s3') as connect_s3, \
+            patch('urllib.request.urlopen'), \
+            patch.object(Key, 'get_acl', return_value='acl'), \
+            patch.object(Key, 'get_contents_as_string', autospec=True,
+                         side_effect=get_contents_as_string):
+        connect_s3.return_value.get_bucket.return_value = bucket
+        with swallow_outputs() as cmo:
+            _ls_s3('s3://bucket/', long_=True, list_content='full',
+                   config_file=opj(path, 's3cfg'), jobs=2)
+            assert_in(" b'0123456789'", cmo.out)
+            # fetching the content does not change the listed details
+            assert_in("2020-01-01 1 ver:v2 ", cmo.out)
+            assert_not_in('2026', cmo.out)
+
+
 @with_tempfile
 def test_ls_repos(toppath):
     # smoke test pretty much
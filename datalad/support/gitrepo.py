@@ -952,6 +952,9 @@ class GitRepo(RepoInterface, metaclass=PathBasedFlyweight):
             self.configure_fake_dates()
         # Set by fake_dates_enabled to cache config value across this instance.
         self._fake_dates_enabled = None
+        # Set by get_indexed_files to reuse its result while the index file
+        # remains unchanged.
+        self._indexed_files_cache = None
 
         # Finally, register a finalizer (instead of having a __del__ method).
         # This will be called by garbage collection as well as "atexit". By
@@ -1779,12 +1782,26 @@ class GitRepo(RepoInterface, metaclass=PathBasedFlyweight):
         list
             list of paths rooting in git's base dir
         """
+        # git never modifies the index in place, but writes a lock file that
+        # is then renamed into place. Hence the stat signature of the index
+        # file reliably tells whether a previous result can be reused
+        try:
+            st = (self.dot_git / 'index').stat()
+            index_sig = (st.st_ino, st.st_mtime_ns, st.st_size)
+        except OSError:
+            index_sig = None
+        if index_sig is not None and self._indexed_files_cache \
+                and self._indexed_files_cache[0] == index_sig:
+            return list(self._indexed_files_cache[1])
 
-        return [
+        indexed_files = [
             str(r.relative_to(self.pathobj))
             for r in self.get_content_info(
                 paths=None, ref=None, untracked='no', eval_file_type=False)
         ]
+        if index_sig is not None:
+            self._indexed_files_cache = (index_sig, tuple(indexed_files))
+        return indexed_files
 
     def format_commit(self, fmt, commitish=None):
         """Return `git show` output for `commitish`.
@@ -150,7 +150,10 @@ class ProducerConsumer:
         safe_to_consume: callable, optional
           A callable which gets a dict of all known futures and current item from producer.
           It should return `True` if executor can proceed with current value from producer.
-          If not (unsafe to consume) - we will wait.
+          If not (unsafe to consume) - we will wait with it, while proceeding with
+          subsequent values.  Keys of the values we wait with are also among
+          the keys of the dict (with `None` as their "future"), so subsequent values
+          would not overtake them.
           WARNING: outside code should make sure about provider and `safe_to_consume` to
           play nicely or a very suboptimal behavior or possibly even a deadlock can happen.
         producer_future_key: callable, optional
@@ -346,6 +349,39 @@ class ProducerConsumer:
         self._producer_thread = Thread(target=producer_worker)
         self._producer_thread.start()
         self._futures = futures = {}
+        # (key, args) of produced jobs which were not yet safe to consume, in
+        # the order they were produced, so they do not hold up other jobs
+        deferred = []
+
+        def submit(job_key, job_args):
+            # Current implementation, to provide depchecking, relies on unique
+            # args for the job
+            assert job_key not in futures
+            lgr.debug("Submitting worker future for %s", job_args)
+            futures[job_key] = executor.submit(consumer_worker, self.consumer, job_args)
+
+        def submit_deferred():
+            """Submit deferred jobs which became safe to consume
+
+            Returns
+            -------
+            bool
+              True if any job was submitted
+            """
+            # jobs still deferred are considered "known" so their dependents
+            # produced later do not overtake them
+            known = dict(futures)
+            still_deferred = []
+            for job_key, job_args in deferred:
+                if self.safe_to_consume(known, job_key):
+                    submit(job_key, job_args)
+                    known[job_key] = futures[job_key]
+                else:
+                    known[job_key] = None
+                    still_deferred.append((job_key, job_args))
+            submitted = len(still_deferred) < len(deferred)
+            deferred[:] = still_deferred
+            return submitted
 
         lgr.debug("Initiating ThreadPoolExecutor with %d jobs", jobs)
         # we will increase sleep_time when doing nothing useful
@@ -365,6 +401,7 @@ class ProducerConsumer:
                         raise self._producer_exception
                     if (self._producer_finished and
                             not futures and
+                            not deferred and
                             consumer_queue.empty() and
                             producer_queue.empty()):
                         # This will let us not "escape" the while loop and reraise any possible exception
@@ -383,16 +420,11 @@ class ProducerConsumer:
                             job_args = producer_queue.get() # timeout=0.001)
                             job_key = self.producer_future_key(job_args) if self.producer_future_key else job_args
                             if self.safe_to_consume:
-                                # Sleep a little if we are not yet ready
-                                # TODO: add some .debug level reporting based on elapsed time
-                                # IIRC I did smth like growing exponentially delays somewhere (dandi?)
-                                while not self.safe_to_consume(futures, job_key):
-                                    self._pop_done_futures(lgr) or sleeper()
-                            # Current implementation, to provide depchecking, relies on unique
-                            # args for the job
-                            assert job_key not in futures
-                            lgr.debug("Submitting worker future for %s", job_args)
-                            futures[job_key] = executor.submit(consumer_worker, self.consumer, job_args)
+                                # whatever is safe gets submitted below, the rest waits
+                                # without blocking the jobs produced after it
+                                deferred.append((job_key, job_args))
+                            else:
+                                submit(job_key, job_args)
                         except Empty:
                             pass
 
@@ -407,6 +439,11 @@ class ProducerConsumer:
 
                     done_useful |= self._pop_done_futures(lgr)
 
+                    # there is no point to recheck deferred jobs unless some new
+                    # ones were produced or some futures are done
+                    if deferred and done_useful and not interrupted_by_exception:
+                        submit_deferred()
+
                     if not done_useful:  # you need some rest
                         # TODO: same here -- progressive logging
                         lgr.log(5,
@@ -435,6 +472,8 @@ class ProducerConsumer:
                             # and we go back into the loop until we finish or there is Ctrl-C
                     else:
                         interrupted_by_exception = exc
+                        # not yet submitted jobs will not be submitted anymore
+                        deferred.clear()
                         lgr.warning("""Received an exception %s.
 Canceling not-yet running jobs and waiting for completion of running.
 You can force earlier forceful exit by Ctrl-C.""",
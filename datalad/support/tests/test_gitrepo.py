@@ -369,6 +369,17 @@ def test_GitRepo_get_indexed_files(path):
     for item in out_list:
         assert_in(item, idx_list, "%s not found in output of get_indexed_files in %s" % (item, path))
 
+    # repeated query of an unchanged index does not call git again
+    from unittest.mock import patch
+    with patch.object(gr, 'get_content_info') as gci:
+        eq_(gr.get_indexed_files(), idx_list)
+    assert_false(gci.called)
+    # but a modified index is noticed
+    with open(op.join(path, 'some3.txt'), 'w') as f:
+        f.write('some3.txt')
+    gr.add('some3.txt')
+    assert_in('some3.txt', gr.get_indexed_files())
+
 
 @with_tree([
     ('empty', ''),
@@ -107,6 +107,32 @@ def test_ProducerConsumer():
         yield check_producer_future_key, jobs
 
 
+@skip_if(not ProducerConsumer._can_use_threads, msg="Test relies on having parallel execution")
+def test_safe_to_consume_no_blocking():
+    from threading import Event
+    c_done = Event()
+    started, finished = [], []
+
+    def consumer(path):
+        started.append(path)
+        if path == 'a':
+            # would time out if 'c' was waiting behind 'a/b'
+            assert c_done.wait(timeout=10)
+        elif path == 'c':
+            c_done.set()
+        finished.append(path)
+        return path
+
+    paths = ['a', 'a/b', 'a/b/c', 'c', 'c/d']
+    assert_equal(
+        sorted(ProducerConsumer(
+            paths, consumer, safe_to_consume=no_parentds_in_futures, jobs=2)),
+        paths)
+    # children are started only after their parents are done
+    for parent, child in (('a', 'a/b'), ('a/b', 'a/b/c'), ('c', 'c/d')):
+        assert_greater(started.index(child), finished.index(parent))
+
+
 @slow  # 12sec on Yarik's laptop
 @with_tempfile(mkdir=True)
 def test_creatsubdatasets(topds_path, n=2):
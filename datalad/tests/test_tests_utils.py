@@ -41,6 +41,7 @@ from datalad.tests.utils import (
     assert_str_equal,
     assert_true,
     eq_,
+    get_dataset_copy,
     get_most_obscure_supported_name,
     ignore_nose_capturing_stdout,
     known_failure_githubci_win,
@@ -670,3 +671,31 @@ def test_ok_file_under_git_symlinks(path):
         ok_file_under_git(op.join(lpath, 'notingit'))
     with assert_raises(AssertionError):
         ok_file_under_git(op.join(lpath, 'nonexisting'))
+
+
+def _create_annex_ds(path):
+    from datalad.api import create
+    ds = create(path)
+    (ds.pathobj / 'file').write_text('content')
+    ds.save()
+
+
+@with_tempfile(mkdir=True)
+@with_tempfile
+def test_get_dataset_copy(path1, path2):
+    ds1 = get_dataset_copy(_create_annex_ds, path1)
+    ds2 = get_dataset_copy(_create_annex_ds, path2)
+    for ds in ds1, ds2:
+        ok_file_has_content(op.join(ds.path, 'file'), 'content')
+        ok_(ds.repo.file_has_content('file'))
+    eq_(ds1.id, ds2.id)
+    # but these are distinct repositories to git-annex
+    ok_(ds1.repo.uuid != ds2.repo.uuid)
+    # and content is known to be present only where it is
+    eq_(ds1.repo.whereis('file'), [ds1.repo.uuid])
+    eq_(ds2.repo.whereis('file'), [ds2.repo.uuid])
+    # and git-annex has no record of the template either
+    for ds in ds1, ds2:
+        eq_([l.split()[0] for l in ds.repo.call_git_items_(
+                ['cat-file', 'blob', 'git-annex:uuid.log'])],
+            [ds.repo.uuid])
@@ -759,6 +759,70 @@ def with_tempfile(t, **tkwargs):
     return  _wrap_with_tempfile
 
 
+def get_tempdir_for_module(prefix):
+    """Create a temporary directory which is removed only upon tests teardown
+
+    Unlike `with_tempfile`, the directory outlives a single test, so it could
+    hold e.g. a fixture shared by all tests of a module.  As with
+    `with_tempfile`, the datalad.tests.temp.dir configuration is respected.
+    """
+    path = tempfile.mkdtemp(**get_tempfile_kwargs(
+        {'dir': dl_cfg.get("datalad.tests.temp.dir")}, prefix=prefix))
+    _TEMP_PATHS_GENERATED.append(path)
+    return path
+
+
+# path of the template dataset per function which populated it
+_DATASET_TEMPLATES = {}
+
+
+def get_dataset_copy(create_template, path):
+    """Provide a copy of a template dataset at `path`
+
+    The template dataset is populated by `create_template(template_path)`
+    only upon the first request for it (per process), and is merely copied
+    afterwards, which is a lot cheaper than creating and saving a new one.
+
+    Each copy is initialized as a new annex, with a new UUID and a fresh
+    git-annex branch, so git-annex knows nothing of the template or other
+    copies.  The dataset ID, which is committed in .datalad/config, remains
+    shared though, so copies must not become subdatasets or siblings of each
+    other.
+
+    Returns
+    -------
+    Dataset
+    """
+    template_path = _DATASET_TEMPLATES.get(create_template)
+    if template_path is None:
+        template_path = get_tempdir_for_module('ds_template')
+        create_template(template_path)
+        _DATASET_TEMPLATES[create_template] = template_path
+    if op.exists(path):
+        # with_tempfile(mkdir=True) provides an empty directory
+        os.rmdir(path)
+    shutil.copytree(template_path, path, symlinks=True)
+    annex_dir = op.join(path, '.git', 'annex')
+    if op.exists(annex_dir):
+        # drop the template's annex identity and its git-annex branch, along
+        # with the state git-annex keeps about that branch
+        for p in ('index', 'index.lck', 'journal'):
+            p = op.join(annex_dir, p)
+            if op.isdir(p):
+                shutil.rmtree(p)
+            elif op.lexists(p):
+                os.unlink(p)
+        runner = GitWitlessRunner(cwd=path)
+        runner.run(['git', 'config', '--unset', 'annex.uuid'])
+        runner.run(['git', 'update-ref', '-d', 'refs/heads/git-annex'])
+        runner.run(['git', 'annex', 'init'], protocol=KillOutput)
+        if op.exists(op.join(annex_dir, 'objects')):
+            # record the content as present in this copy
+            runner.run(['git', 'annex', 'fsck', '--fast', '--quiet'],
+                       protocol=KillOutput)
+    return Dataset(path)
+
+
 # ### ###
 # START known failure decorators
 # ### ###
@@ -966,9 +1030,10 @@ def clone_url(url):
 local_testrepo_flavors = ['local'] # 'local-url'
 
 _TESTREPOS = None
+_TESTREPOS_INSTANCES = None
 
 def _get_testrepos_uris(regex, flavors):
-    global _TESTREPOS
+    global _TESTREPOS, _TESTREPOS_INSTANCES
     # we should instantiate those whenever test repos actually asked for
     # TODO: just absorb all this lazy construction within some class
     if not _TESTREPOS:
@@ -1001,17 +1066,21 @@ def _get_testrepos_uris(regex, flavors):
                         {'local': _inner_submodule_annex_test_repo.path,
                          'local-url': _inner_submodule_annex_test_repo.url}
                       }
-        # assure that now we do have those test repos created -- delayed
-        # their creation until actually used
-        _basic_annex_test_repo.create()
-        _basic_git_test_repo.create()
-        _submodule_annex_test_repo.create()
-        _nested_submodule_annex_test_repo.create()
-        _inner_submodule_annex_test_repo.create()
+        _TESTREPOS_INSTANCES = {
+            'basic_annex': _basic_annex_test_repo,
+            'basic_git': _basic_git_test_repo,
+            'submodule_annex': _submodule_annex_test_repo,
+            'nested_submodule_annex': _nested_submodule_annex_test_repo,
+            'inner_submodule': _inner_submodule_annex_test_repo,
+        }
     uris = []
     for name, spec in _TESTREPOS.items():
         if not re.match(regex, name):
             continue
+        # assure that now we do have this test repo created -- delayed
+        # its creation until actually used, and done only once per process.
+        # The nested ones are costly, and not needed by most tests
+        _TESTREPOS_INSTANCES[name].create()
         uris += [spec[x] for x in set(spec.keys()).intersection(flavors)]
 
         # additional flavors which might have not been
@@ -405,17 +405,26 @@ def rotree(path, ro=True, chmod_files=True):
       Whether to operate also on files (not just directories)
     """
     if ro:
-        chmod = lambda f: os.chmod(f, os.stat(f).st_mode & ~stat.S_IWRITE)
+        get_mode = lambda mode: mode & ~stat.S_IWRITE
     else:
-        chmod = lambda f: os.chmod(f, os.stat(f).st_mode | stat.S_IWRITE | stat.S_IREAD)
+        get_mode = lambda mode: mode | stat.S_IWRITE | stat.S_IREAD
+
+    def chmod(f):
+        try:
+            mode = os.stat(f).st_mode
+        except FileNotFoundError:
+            # might be the "broken" symlink which would fail to stat etc
+            return
+        new_mode = get_mode(mode)
+        # most of the tree typically has the desired mode already,
+        # so spare the syscall
+        if new_mode != mode:
+            os.chmod(f, new_mode)
 
     for root, dirs, files in os.walk(path, followlinks=False):
         if chmod_files:
             for f in files:
-                fullf = opj(root, f)
-                # might be the "broken" symlink which would fail to stat etc
-                if exists(fullf):
-                    chmod(fullf)
+                chmod(opj(root, f))
         chmod(root)
 
 
@@ -2379,8 +2388,8 @@ def create_tree(path, tree, archives_leading_dir=True, remove_existing=False):
     with that content and place it into the tree if name ends with .tar.gz
     """
     lgr.log(5, "Creating a tree under %s", path)
-    if not op.exists(path):
-        os.makedirs(path)
+    # a single mkdir() for a new directory instead of stat() + mkdir()
+    os.makedirs(path, exist_ok=True)
 
     if isinstance(tree, dict):
         tree = tree.items()
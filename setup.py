@@ -76,7 +76,7 @@ requires = {
     ],
 }
 
-requires['full'] = sum(list(requires.values()), [])
+requires['full'] = sorted({r for reqs in requires.values() for r in reqs})
 
 # Now add additional ones useful for development
 requires.update({
@@ -102,7 +102,7 @@ requires.update({
         # 'dbus-python',
     ],
 })
-requires['devel'] = sum(list(requires.values()), [])
+requires['devel'] = sorted({r for reqs in requires.values() for r in reqs})
 
 
 # let's not build manpages and examples automatically (gh-896)